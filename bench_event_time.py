@@ -0,0 +1,84 @@
+import time
+import heapq
+import random
+
+from dgim import Dgim, EventTimeDgim
+from dgim.utils import generate_random_stream
+
+
+def generate_events(length, max_lateness, seed=0):
+    """Events (event_time, elt) delayed by up to max_lateness,
+    in arrival order."""
+    rng = random.Random(seed)
+    stream = list(generate_random_stream(length, seed=seed))
+    arrivals = sorted(range(length),
+                      key=lambda i: i + rng.uniform(0, max_lateness))
+    return [(i, stream[i]) for i in arrivals]
+
+
+def measure_event_time(events, N, max_lateness):
+    """Returns the run time, the mean and max number of buffered events.
+    The mean number of buffered events is the mean delay, in arrivals,
+    between the arrival of an event and its commit."""
+    event_time_dgim = EventTimeDgim(N, max_lateness=max_lateness)
+    total_buffered = 0
+    max_buffered = 0
+    time_start = time.time()
+    for event_time, elt in events:
+        event_time_dgim.update(event_time, elt)
+        event_time_dgim.get_count()
+        nb_buffered = event_time_dgim.nb_buffered
+        total_buffered += nb_buffered
+        max_buffered = max(max_buffered, nb_buffered)
+    event_time_dgim.flush()
+    time_stop = time.time()
+    return (time_stop - time_start, total_buffered / float(len(events)),
+            max_buffered)
+
+
+def measure_pre_sort(events, N, max_lateness):
+    """A separate sort stage ahead of a Dgim: a reorder heap releases
+    the events which are max_lateness behind the latest event time.
+    Returns the same measures as measure_event_time."""
+    dgim = Dgim(N)
+    reorder_heap = []
+    max_event_time = None
+    total_buffered = 0
+    max_buffered = 0
+    time_start = time.time()
+    for arrival, (event_time, elt) in enumerate(events):
+        if max_event_time is None or event_time > max_event_time:
+            max_event_time = event_time
+        heapq.heappush(reorder_heap, (event_time, arrival, elt))
+        while reorder_heap[0][0] <= max_event_time - max_lateness:
+            _, _, released_elt = heapq.heappop(reorder_heap)
+            dgim.update(released_elt)
+            if not reorder_heap:
+                break
+        dgim.get_count()
+        nb_buffered = len(reorder_heap)
+        total_buffered += nb_buffered
+        max_buffered = max(max_buffered, nb_buffered)
+    while reorder_heap:
+        _, _, released_elt = heapq.heappop(reorder_heap)
+        dgim.update(released_elt)
+    time_stop = time.time()
+    return (time_stop - time_start, total_buffered / float(len(events)),
+            max_buffered)
+
+
+def run_event_time_benchmark(N=10000, length=200000):
+    for max_lateness in [0, 10, 100, 1000]:
+        events = generate_events(length, max_lateness)
+        for name, measures in [
+                ("event time", measure_event_time(events, N, max_lateness)),
+                ("pre-sort", measure_pre_sort(events, N, max_lateness))]:
+            run_time, mean_delay, max_buffered = measures
+            print("lateness={} {}: {:.0f} events/s, mean delay {:.1f} "
+                  "events, max buffered {}".format(
+                      max_lateness, name, length / run_time, mean_delay,
+                      max_buffered))
+
+
+if __name__ == "__main__":
+    run_event_time_benchmark()
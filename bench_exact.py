@@ -0,0 +1,32 @@
+import time
+
+from dgim import Dgim
+from dgim.exact import ExactCounter
+from dgim.planner import measure_footprint
+from dgim.utils import generate_random_stream
+
+
+def measure_update_time(counter, stream):
+    time_start = time.time()
+    for elt in stream:
+        counter.update(elt)
+        counter.get_count()
+    time_stop = time.time()
+    return time_stop - time_start
+
+
+def run_crossover_benchmark(error_rate=0.5, iterations=200000):
+    stream = list(generate_random_stream(iterations, seed=0))
+    for i in range(4, 25, 2):
+        N = 2 ** i
+        exact_counter = ExactCounter(N)
+        dgim = Dgim(N, error_rate)
+        exact_time = measure_update_time(exact_counter, stream)
+        dgim_time = measure_update_time(dgim, stream)
+        print("N={} exact {:.3f}s ({} bytes) dgim {:.3f}s ({} bytes)".format(
+            N, exact_time, measure_footprint(exact_counter),
+            dgim_time, measure_footprint(dgim)))
+
+
+if __name__ == "__main__":
+    run_crossover_benchmark()
@@ -8,11 +8,12 @@ from dgim.utils import generate_random_stream
 def measure_update_time(N, iterations):
     dgim = Dgim(N)
     # initialization
-    for elt in generate_random_stream(N):
+    for elt in generate_random_stream(N, seed=0):
         dgim.update(elt)
+    stream = list(generate_random_stream(iterations, seed=1))
     time_start = time.time()
     bucket_count = 0
-    for elt in generate_random_stream(iterations):
+    for elt in stream:
         dgim.update(elt)
         bucket_count += dgim.nb_buckets
     time_stop = time.time()
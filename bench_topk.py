@@ -0,0 +1,95 @@
+import time
+import heapq
+import random
+from collections import deque, Counter
+
+from dgim import Dgim, KeyedDgim
+
+
+class ScanTopK(object):
+    """One Dgim per key, every Dgim is updated on every element
+    and top_k scans all the keys."""
+    def __init__(self, N, error_rate):
+        self.N = N
+        self.error_rate = error_rate
+        self.dgims = {}
+
+    def update(self, key):
+        if key not in self.dgims:
+            self.dgims[key] = Dgim(self.N, self.error_rate)
+        for other_key, dgim in self.dgims.items():
+            dgim.update(other_key == key)
+
+    def top_k(self, k):
+        counts = ((key, dgim.get_count()) for key, dgim in self.dgims.items())
+        return heapq.nlargest(k, counts, key=lambda item: item[1])
+
+
+class ExactTopK(object):
+    def __init__(self, N):
+        self.N = N
+        self.window = deque()
+        self.counts = Counter()
+
+    def update(self, key):
+        self.window.append(key)
+        self.counts[key] += 1
+        if len(self.window) > self.N:
+            self.counts[self.window.popleft()] -= 1
+
+    def top_k(self, k):
+        return self.counts.most_common(k)
+
+
+def generate_keys(nb_keys, length, seed=0):
+    """Zipf-like stream of keys, like the source IPs of requests."""
+    rng = random.Random(seed)
+    weights = [1.0 / (rank + 1) for rank in range(nb_keys)]
+    return rng.choices(range(nb_keys), weights=weights, k=length)
+
+
+def measure(algorithm, stream, k, query_every):
+    update_time = 0.
+    query_time = 0.
+    results = []
+    for i, key in enumerate(stream):
+        time_start = time.time()
+        algorithm.update(key)
+        update_time += time.time() - time_start
+        if i % query_every == 0:
+            time_start = time.time()
+            results.append(algorithm.top_k(k))
+            query_time += time.time() - time_start
+    return update_time, query_time / len(results), results
+
+
+def recall(results, exact_results):
+    total = 0.
+    for result, exact_result in zip(results, exact_results):
+        keys = set(key for key, _ in result)
+        exact_keys = set(key for key, _ in exact_result)
+        total += len(keys & exact_keys) / float(max(len(exact_keys), 1))
+    return total / len(results)
+
+
+def run_topk_benchmark():
+    N = 10000
+    error_rate = 0.1
+    k = 10
+    length = 20000
+    query_every = 100
+    for nb_keys in [10, 100, 1000]:
+        stream = generate_keys(nb_keys, length)
+        _, _, exact_results = measure(ExactTopK(N), stream, k, query_every)
+        for name, algorithm in [("keyed", KeyedDgim(N, error_rate)),
+                                ("scan", ScanTopK(N, error_rate))]:
+            update_time, query_time, results = measure(
+                algorithm, stream, k, query_every)
+            print("keys={} {}: update {:.3f}s, top_k {:.1f}us, "
+                  "recall {:.3f}".format(
+                      nb_keys, name, update_time, query_time * 1e6,
+                      recall(results, exact_results)))
+
+
+if __name__ == "__main__":
+    run_topk_benchmark()
@@ -5,3 +5,7 @@ __email__ = 'simon.dolle@gmail.com'
 __version__ = '0.2.0'
 
 from .dgim import Dgim
+from .keyed import KeyedDgim
+from .exact import ExactCounter
+from .factory import create_counter
+from .event_time import EventTimeDgim
@@ -1,6 +1,19 @@
 import math
 from collections import deque
 
+
+def _check_error_rate(error_rate):
+    """Raise a ValueError if error_rate is not in ]0, 1].
+
+    :param error_rate: the error rate
+    :type error_rate: float
+    """
+    if not (0 < error_rate <= 1):
+        error_msg = ("Invalid value for error_rate: {}. "
+                     "Error rate should be in ]0, 1].".format(error_rate))
+        raise ValueError(error_msg)
+
+
 class Dgim(object):
     """An implementation of the DGIM algorithm.
     It estimates the number of "True" present the last N elements
@@ -33,11 +46,7 @@ class Dgim(object):
         """
         self.N = N
 
-        if not (0 < error_rate <= 1):
-            error_msg = ("Invalid value for error_rate: {}. "
-                         "Error rate should be in ]0, 1].".format(error_rate))
-            raise ValueError(error_msg)
-
+        _check_error_rate(error_rate)
         self.error_rate = error_rate
 
         #the maximum number of buckets of the same size
@@ -93,6 +102,27 @@ class Dgim(object):
             if last == self._oldest_bucket_timestamp:
                 self._oldest_bucket_timestamp = second_last
 
+    def skip(self, nb_elements):
+        """Update the stream with several "False" elements at once.
+
+        This is equivalent to calling update(False) nb_elements times,
+        but it only costs O(log(N)).
+
+        :param nb_elements: the number of "False" elements to add
+        :type nb_elements: int
+        """
+        if self.N == 0 or nb_elements <= 0:
+            return
+        if nb_elements >= self.N:
+            # every bucket falls out of the window
+            for queue in self._queues:
+                queue.clear()
+            self._oldest_bucket_timestamp = -1
+        self._timestamp = (self._timestamp + nb_elements) % (2 * self.N)
+        while (self._oldest_bucket_timestamp >= 0 and
+                self._is_bucket_too_old(self._oldest_bucket_timestamp)):
+            self._drop_oldest_bucket()
+
     def get_count(self):
         """Returns an estimate of the number of "True"
         in the last N elements of the stream.
@@ -132,6 +162,18 @@ class Dgim(object):
             result += len(queue)
         return result
 
+    @property
+    def nb_steps_before_expiry(self):
+        """Returns the number of updates after which the oldest bucket
+        is dropped, or None if there is no bucket.
+
+        :rtype: int
+        """
+        if self._oldest_bucket_timestamp == -1:
+            return None
+        age = (self._timestamp - self._oldest_bucket_timestamp) % (2 * self.N)
+        return self.N - age
+
     def _drop_oldest_bucket(self):
         """Drop oldest bucket timestamp."""
         for queue in reversed(self._queues):
@@ -0,0 +1,131 @@
+import heapq
+import itertools
+
+from .dgim import Dgim
+
+# number of buffered events which triggers a commit
+DEFAULT_BATCH_SIZE = 1024
+
+
+class EventTimeDgim(object):
+    """Estimates the number of "True" in the last N elements of a boolean
+    stream whose elements arrive slightly out of order.
+
+    Each element comes with an event time. Elements are buffered and
+    committed to a Dgim in event time order, once no element arriving
+    within the lateness bound can precede them anymore. Elements older
+    than this bound are late: they are counted and dropped.
+    """
+
+    def __init__(self, N, error_rate=0.5, max_lateness=0,
+                 batch_size=DEFAULT_BATCH_SIZE):
+        """Constructor
+
+        :param N: sliding window width. See Dgim.__init__.
+        :type N: int
+        :param error_rate: the maximum error made by the algorithm.
+        See Dgim.__init__.
+        :type error_rate: float
+        :param max_lateness: how far, in event time, an element can arrive
+        behind the latest event time seen so far without being late.
+        :type max_lateness: int or float
+        :param batch_size: the number of buffered elements which
+        triggers a commit to the Dgim.
+        :type batch_size: int
+        """
+        if max_lateness < 0:
+            error_msg = ("Invalid value for max_lateness: {}. "
+                         "Max lateness should be >= 0.".format(max_lateness))
+            raise ValueError(error_msg)
+        if batch_size < 1:
+            error_msg = ("Invalid value for batch_size: {}. "
+                         "Batch size should be >= 1.".format(batch_size))
+            raise ValueError(error_msg)
+
+        self._dgim = Dgim(N, error_rate)
+        self.N = N
+        self.error_rate = error_rate
+        self.max_lateness = max_lateness
+        self.batch_size = batch_size
+
+        # number of late elements dropped so far
+        self.nb_late = 0
+
+        # min-heap of (event time, arrival number, element).
+        # The arrival number keeps elements with the same event time
+        # in arrival order.
+        self._buffer = []
+        self._arrivals = itertools.count()
+        self._max_event_time = None
+        # event time of the last element committed by flush
+        self._flushed_event_time = None
+
+    def update(self, event_time, elt):
+        """Update the stream with one element.
+
+        :param event_time: the event time of the element
+        :type event_time: int or float
+        :param elt: the element
+        :type elt: bool
+        """
+        if self._max_event_time is None or event_time > self._max_event_time:
+            self._max_event_time = event_time
+        elif event_time < self.watermark:
+            self.nb_late += 1
+            return
+        heapq.heappush(self._buffer, (event_time, next(self._arrivals), elt))
+        if len(self._buffer) >= self.batch_size:
+            self._commit()
+
+    def get_count(self):
+        """Returns an estimate of the number of "True"
+        in the last N committed elements of the stream.
+
+        Elements are committed once their event time is not after
+        the watermark.
+
+        :rtype: int
+        """
+        self._commit()
+        return self._dgim.get_count()
+
+    def flush(self):
+        """Commit all the buffered elements, as if the stream ended.
+        Elements arriving afterwards with an earlier event time are late.
+        """
+        while self._buffer:
+            event_time, _, elt = heapq.heappop(self._buffer)
+            self._dgim.update(elt)
+            self._flushed_event_time = event_time
+
+    @property
+    def watermark(self):
+        """Returns the event time before which elements are late,
+        or None if no element was seen.
+
+        :rtype: int or float
+        """
+        if self._max_event_time is None:
+            return None
+        watermark = self._max_event_time - self.max_lateness
+        if self._flushed_event_time is not None:
+            watermark = max(watermark, self._flushed_event_time)
+        return watermark
+
+    @property
+    def nb_buffered(self):
+        """Returns the number of elements waiting to be committed.
+
+        :rtype: int
+        """
+        return len(self._buffer)
+
+    def _commit(self):
+        """Commit the buffered elements which are not after the watermark,
+        in event time order."""
+        watermark = self.watermark
+        buffer = self._buffer
+        update = self._dgim.update
+        while buffer and buffer[0][0] <= watermark:
+            _, _, elt = heapq.heappop(buffer)
+            update(elt)
@@ -0,0 +1,60 @@
+class ExactCounter(object):
+    """Exact count of the number of "True" in the last N elements
+    of a boolean stream.
+
+    It has the same interface as Dgim. The last N elements are stored
+    in a ring buffer of bits, along with a running count of the "True".
+    Update and query are O(1) and the memory footprint is N bits,
+    which is cheaper than Dgim for small windows.
+    """
+
+    def __init__(self, N):
+        """Constructor
+
+        :param N: sliding window width.
+                  The counter will return the number of "True"
+                  in the last N elements of the stream.
+        :type N: int
+        """
+        self.N = N
+        # the count is exact
+        self.error_rate = 0
+
+        # bit i of the ring buffer is stored in
+        # the bit i % 8 of the byte i // 8
+        self._bits = bytearray((N + 7) // 8)
+        # position of the oldest element in the ring buffer
+        self._index = 0
+        self._count = 0
+
+    def update(self, elt):
+        """Update the stream with one element.
+
+        :param elt: the latest element of the stream
+        :type elt: bool
+        """
+        if self.N == 0:
+            return
+        index = self._index
+        byte_index = index >> 3
+        mask = 1 << (index & 7)
+        byte = self._bits[byte_index]
+        if elt is True:
+            if not byte & mask:
+                self._bits[byte_index] = byte | mask
+                self._count += 1
+        elif byte & mask:
+            self._bits[byte_index] = byte ^ mask
+            self._count -= 1
+        index += 1
+        if index == self.N:
+            index = 0
+        self._index = index
+
+    def get_count(self):
+        """Returns the number of "True" in the last N elements
+        of the stream.
+
+        :rtype: int
+        """
+        return self._count
@@ -0,0 +1,39 @@
+from .dgim import Dgim, _check_error_rate
+from .exact import ExactCounter
+from .planner import (predict_footprint, predict_exact_footprint,
+                      dgim_for_budget)
+
+
+def create_counter(N, error_rate=0.5, memory_budget=None):
+    """Create a counter of the number of "True" in the last N elements
+    of a boolean stream, picking the cheapest storage.
+
+    ExactCounter is faster than Dgim and makes no error, but its
+    footprint grows linearly with N. It is picked whenever it fits in
+    the memory budget or, if there is no budget, whenever it is not
+    bigger than a Dgim with the requested error rate.
+
+    Otherwise a Dgim is returned. If a Dgim with the requested error rate
+    does not fit in the memory budget either, the error rate is raised
+    to the lowest one which fits (see dgim.planner.dgim_for_budget).
+    A ValueError is raised if no counter fits in the budget.
+
+    :param N: sliding window width.
+    :type N: int
+    :param error_rate: the maximum error rate of the counter.
+    See Dgim.__init__.
+    :type error_rate: float
+    :param memory_budget: the maximum number of bytes of the counter,
+    as measured by dgim.planner.measure_footprint, or None.
+    :type memory_budget: int
+    :rtype: ExactCounter or Dgim
+    """
+    _check_error_rate(error_rate)
+    dgim_footprint = predict_footprint(N, error_rate)
+    if memory_budget is None:
+        memory_budget = dgim_footprint
+    if predict_exact_footprint(N) <= memory_budget:
+        return ExactCounter(N)
+    if dgim_footprint <= memory_budget:
+        return Dgim(N, error_rate)
+    return dgim_for_budget(N, memory_budget)
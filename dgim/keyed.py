@@ -0,0 +1,186 @@
+import heapq
+import itertools
+
+from .dgim import Dgim, _check_error_rate
+
+
+class KeyedDgim(object):
+    """Estimates, for every key of a stream, the number of occurrences
+    of this key in the last N elements of the stream, and keeps track
+    of the keys with the highest estimates.
+
+    Each key has its own Dgim instance. Instead of feeding a "False" to
+    every other key on each update, a key is only brought up to date
+    when it is updated or when its oldest bucket expires. The estimates
+    are indexed in a heap so that top_k(k) costs O(k log(keys))
+    amortized, instead of a scan over all the keys.
+    """
+
+    def __init__(self, N, error_rate=0.5):
+        """Constructor
+
+        :param N: sliding window width.
+                  The estimates count the occurrences of each key
+                  in the last N elements of the stream.
+        :type N: int
+        :param error_rate: the maximum error made on each estimate.
+        See Dgim.__init__.
+        :type error_rate: float
+        """
+        _check_error_rate(error_rate)
+        self.N = N
+        self.error_rate = error_rate
+
+        # number of elements seen so far
+        self._position = 0
+
+        # key -> Dgim of the key
+        self._dgims = {}
+        # key -> position of the last time the Dgim of the key
+        # was brought up to date
+        self._positions = {}
+        # key -> current estimate
+        self._counts = {}
+
+        # tie breaker for the heaps, so that keys are never compared
+        self._sequence = itertools.count()
+
+        # max-heap of (-estimate, sequence number, key).
+        # Entries are not removed when an estimate changes,
+        # they are skipped when they do not match self._counts.
+        self._rank_heap = []
+
+        # min-heap of (expiry position, sequence number, key).
+        # self._expiries holds the only valid expiry position of each key.
+        self._expiry_heap = []
+        self._expiries = {}
+
+    def update(self, key):
+        """Update the stream with one element.
+
+        :param key: the key of the latest element of the stream
+        :type key: hashable
+        """
+        if self.N == 0:
+            return
+        dgim = self._dgims.get(key)
+        if dgim is None:
+            dgim = Dgim(self.N, self.error_rate)
+            self._dgims[key] = dgim
+            self._positions[key] = self._position
+        self._catch_up(key)
+        self._position += 1
+        dgim.update(True)
+        self._positions[key] = self._position
+        self._set_count(key, dgim.get_count())
+        self._schedule_expiry(key)
+        self._expire()
+
+    def get_count(self, key):
+        """Returns an estimate of the number of occurrences of key
+        in the last N elements of the stream.
+
+        :param key: the key
+        :type key: hashable
+        :rtype: int
+        """
+        self._expire()
+        return self._counts.get(key, 0)
+
+    def top_k(self, k):
+        """Returns the k keys with the highest estimates,
+        along with their estimates, in descending order of estimate.
+
+        :param k: the number of keys to return
+        :type k: int
+        :rtype: list of (key, int)
+        """
+        self._expire()
+        result = []
+        seen = set()
+        valid_entries = []
+        while self._rank_heap and len(result) < k:
+            entry = heapq.heappop(self._rank_heap)
+            negated_count, _, key = entry
+            if key in seen or self._counts.get(key) != -negated_count:
+                # stale or duplicate entry, drop it
+                continue
+            seen.add(key)
+            valid_entries.append(entry)
+            result.append((key, -negated_count))
+        for entry in valid_entries:
+            heapq.heappush(self._rank_heap, entry)
+        return result
+
+    @property
+    def nb_keys(self):
+        """Returns the number of keys with a non zero estimate.
+
+        :rtype: int
+        """
+        return len(self._counts)
+
+    def _catch_up(self, key):
+        """Feed the Dgim of a key with the "False" elements it missed
+        since it was last brought up to date.
+
+        :param key: the key
+        :type key: hashable
+        """
+        self._dgims[key].skip(self._position - self._positions[key])
+        self._positions[key] = self._position
+
+    def _expire(self):
+        """Bring up to date the keys whose oldest bucket has expired."""
+        while (self._expiry_heap and
+                self._expiry_heap[0][0] <= self._position):
+            expiry_position, _, key = heapq.heappop(self._expiry_heap)
+            if self._expiries.get(key) != expiry_position:
+                # stale entry
+                continue
+            del self._expiries[key]
+            self._catch_up(key)
+            self._set_count(key, self._dgims[key].get_count())
+            self._schedule_expiry(key)
+
+    def _schedule_expiry(self, key):
+        """Register the position at which the oldest bucket
+        of a key expires.
+
+        :param key: the key
+        :type key: hashable
+        """
+        nb_steps = self._dgims[key].nb_steps_before_expiry
+        if nb_steps is None:
+            # no bucket left, forget the key
+            del self._dgims[key]
+            del self._positions[key]
+            self._expiries.pop(key, None)
+            return
+        expiry_position = self._positions[key] + nb_steps
+        if self._expiries.get(key) != expiry_position:
+            self._expiries[key] = expiry_position
+            heapq.heappush(self._expiry_heap,
+                           (expiry_position, next(self._sequence), key))
+
+    def _set_count(self, key, count):
+        """Update the estimate of a key and index it.
+
+        :param key: the key
+        :type key: hashable
+        :param count: the new estimate
+        :type count: int
+        """
+        if self._counts.get(key) == count:
+            return
+        if count == 0:
+            self._counts.pop(key, None)
+        else:
+            self._counts[key] = count
+            heapq.heappush(self._rank_heap,
+                           (-count, next(self._sequence), key))
+        if len(self._rank_heap) > 2 * len(self._counts) + 16:
+            # too many stale entries, rebuild the heap
+            self._rank_heap = [(-c, next(self._sequence), k)
+                               for k, c in self._counts.items()]
+            heapq.heapify(self._rank_heap)
@@ -0,0 +1,183 @@
+import sys
+import math
+from collections import deque
+
+from .dgim import Dgim
+from .exact import ExactCounter
+
+# number of elements stored in a block of a CPython deque
+_DEQUE_BLOCK_LENGTH = 64
+
+
+def predict_nb_buckets(N, error_rate=0.5):
+    """Returns the maximum number of buckets a Dgim can hold.
+
+    The worst case is reached when every queue holds r buckets,
+    starting from the smallest buckets, until they cover the window.
+    An all "True" stream reaches it.
+
+    :param N: sliding window width.
+    :type N: int
+    :param error_rate: the error rate. See Dgim.__init__.
+    :type error_rate: float
+    :rtype: int
+    """
+    dgim = Dgim(N, error_rate)
+    result = 0
+    covered = 0
+    for i in range(len(dgim._queues)):
+        if covered >= N:
+            break
+        bucket_size = 1 << i
+        # a bucket is in the window as long as its latest "True" is
+        nb_buckets = min(dgim._r,
+                         (N - covered + bucket_size - 1) // bucket_size)
+        result += nb_buckets
+        covered += nb_buckets * bucket_size
+    return int(result)
+
+
+def predict_footprint(N, error_rate=0.5):
+    """Returns an upper bound of the number of bytes used by a Dgim,
+    as measured by measure_footprint.
+
+    :param N: sliding window width.
+    :type N: int
+    :param error_rate: the error rate. See Dgim.__init__.
+    :type error_rate: float
+    :rtype: int
+    """
+    dgim = Dgim(N, error_rate)
+    result = measure_footprint(dgim)
+    if N == 0:
+        return result
+    timestamp_size = sys.getsizeof(2 * N - 1)
+    # _timestamp and _oldest_bucket_timestamp
+    result += 2 * (timestamp_size - sys.getsizeof(0))
+    result += predict_nb_buckets(N, error_rate) * timestamp_size
+    # Between two updates, the queue i holds at most r timestamps, and
+    # no more than the buckets of size 2^i fitting in the window next to
+    # the lower queues, which hold at least r - 1 buckets each once the
+    # queue i is used. n > 1 timestamps can straddle one more block
+    # than they fill.
+    block_size = (sys.getsizeof(deque(range(_DEQUE_BLOCK_LENGTH))) -
+                  sys.getsizeof(deque()))
+    r = int(dgim._r)
+    for i in range(len(dgim._queues)):
+        bucket_size = 1 << i
+        lower_queues_coverage = (r - 1) * (bucket_size - 1)
+        if lower_queues_coverage >= N:
+            break
+        queue_length = min(r, (N - lower_queues_coverage + bucket_size - 1)
+                           // bucket_size)
+        if queue_length > 1:
+            nb_extra_blocks = (queue_length - 1) // _DEQUE_BLOCK_LENGTH + 1
+            result += nb_extra_blocks * block_size
+    return result
+
+
+def predict_exact_footprint(N):
+    """Returns the number of bytes used by an ExactCounter,
+    as measured by measure_footprint.
+
+    :param N: sliding window width.
+    :type N: int
+    :rtype: int
+    """
+    result = measure_footprint(ExactCounter(0))
+    nb_bytes = (N + 7) // 8
+    if nb_bytes > 0:
+        result += sys.getsizeof(bytearray(1)) - sys.getsizeof(bytearray())
+        result += nb_bytes - 1
+    # _count
+    result += sys.getsizeof(N) - sys.getsizeof(0)
+    return result
+
+
+def measure_footprint(counter):
+    """Returns the number of bytes used by a counter:
+    the object, its attributes and the content of its containers.
+
+    :param counter: the counter
+    :type counter: Dgim or ExactCounter
+    :rtype: int
+    """
+    # the attributes dict of an instance may share its keys with the
+    # other instances, which makes its size vary: measure a copy instead
+    result = sys.getsizeof(counter) + sys.getsizeof(dict(vars(counter)))
+    for value in vars(counter).values():
+        result += _measure_value(value)
+    return result
+
+
+def error_rate_for_budget(N, memory_budget):
+    """Returns the lowest error rate of a Dgim whose predicted
+    footprint fits in a memory budget.
+
+    :param N: sliding window width.
+    :type N: int
+    :param memory_budget: the maximum number of bytes of the Dgim.
+    :type memory_budget: int
+    :rtype: float
+    """
+    min_footprint = predict_footprint(N, _error_rate(2))
+    if min_footprint > memory_budget:
+        error_msg = ("Invalid value for memory_budget: {}. "
+                     "A Dgim with N={} needs at least {} bytes.".format(
+                         memory_budget, N, min_footprint))
+        raise ValueError(error_msg)
+    # once r reaches N, the buckets never merge:
+    # the count is exact and the footprint does not grow anymore
+    low = 2
+    high = max(N, 2)
+    if predict_footprint(N, _error_rate(high)) <= memory_budget:
+        return _error_rate(high)
+    # predict_footprint(low) <= memory_budget < predict_footprint(high)
+    while high - low > 1:
+        middle = (low + high) // 2
+        if predict_footprint(N, _error_rate(middle)) <= memory_budget:
+            low = middle
+        else:
+            high = middle
+    return _error_rate(low)
+
+
+def dgim_for_budget(N, memory_budget):
+    """Create the most accurate Dgim whose predicted footprint
+    fits in a memory budget.
+
+    :param N: sliding window width.
+    :type N: int
+    :param memory_budget: the maximum number of bytes of the Dgim.
+    :type memory_budget: int
+    :rtype: Dgim
+    """
+    return Dgim(N, error_rate_for_budget(N, memory_budget))
+
+
+def _error_rate(r):
+    """Returns the highest error rate for which Dgim uses r buckets
+    per queue.
+
+    :param r: the maximum number of buckets of the same size
+    :type r: int
+    :rtype: float
+    """
+    error_rate = 1.0 / r
+    if math.ceil(1 / error_rate) > r:
+        # rounding error, 1 / error_rate is slightly above r
+        error_rate = 1.0 / (r - 1e-9)
+    return error_rate
+
+
+def _measure_value(value):
+    """Returns the number of bytes used by a value,
+    including the content of lists and deques.
+
+    :rtype: int
+    """
+    result = sys.getsizeof(value)
+    if isinstance(value, (list, deque)):
+        for item in value:
+            result += _measure_value(item)
+    return result
@@ -1,11 +1,296 @@
+import math
 import random
+import itertools
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
-def generate_random_stream(length):
+# number of elements generated at once
+DEFAULT_CHUNK_SIZE = 4096
+
+
+class _RandomSource(object):
+    """Seeded source of random batches, backed by the random module
+    or, on request, by NumPy.
+    A given seed gives the same stream on a given backend only.
+    """
+
+    def __init__(self, seed=None, use_numpy=False):
+        """Constructor
+
+        :param seed: the seed, or None to draw from the global random
+        module state (or from fresh entropy with NumPy)
+        :type seed: int
+        :param use_numpy: whether to generate the batches with NumPy
+        :type use_numpy: bool
+        """
+        self._use_numpy = use_numpy
+        if use_numpy:
+            if numpy is None:
+                raise ImportError("use_numpy=True requires NumPy.")
+            self._generator = numpy.random.default_rng(seed)
+        elif seed is None:
+            # keep the streams reproducible with random.seed()
+            self._random = random
+        else:
+            self._random = random.Random(seed)
+
+    def booleans(self, size, p):
+        """Returns a list of booleans which are True with probability p.
+
+        :param size: the number of booleans
+        :type size: int
+        :param p: the probability of True
+        :type p: float
+        :rtype: list of bool
+        """
+        if self._use_numpy:
+            return (self._generator.random(size) < p).tolist()
+        if p == 0.5:
+            # one random bit per element is much faster
+            bits = bin(self._random.getrandbits(size))[2:].zfill(size)
+            return [bit == "1" for bit in bits]
+        uniform = self._random.random
+        return [uniform() < p for _ in range(size)]
+
+    def run_lengths(self, size, mean):
+        """Returns a list of geometric random run lengths,
+        all greater or equal to 1.
+
+        :param size: the number of run lengths
+        :type size: int
+        :param mean: the mean run length, greater or equal to 1
+        :type mean: float
+        :rtype: list of int
+        """
+        p = 1.0 / mean
+        if self._use_numpy:
+            return self._generator.geometric(p, size).tolist()
+        if p == 1:
+            return [1] * size
+        log_q = math.log(1 - p)
+        uniform = self._random.random
+        return [1 + int(math.log(1 - uniform()) / log_q)
+                for _ in range(size)]
+
+
+def generate_random_stream(length, seed=None, use_numpy=False):
     """Generate a random stream of booleans.
+
+    All the random generators of this module are reproducible:
+    - with a seed, the stream only depends on the seed and on use_numpy.
+      NumPy and the random module give different streams for the same
+      seed.
+    - without a seed, the stream is drawn from the global state of the
+      random module, which random.seed() controls. With NumPy, it is
+      drawn from fresh entropy and is not reproducible.
+
+    :param length: the stream length
+    :type length: int
+    :param seed: the seed, or None to use the random module state
+    :type seed: int
+    :param use_numpy: whether to generate the stream with NumPy,
+    which is faster but must be installed
+    :type use_numpy: bool
+    :returns: iterator
+    """
+    return generate_bernoulli_stream(length, p=0.5, seed=seed,
+                                     use_numpy=use_numpy)
+
+
+def generate_bernoulli_stream(length, p=0.5, seed=None, use_numpy=False):
+    """Generate a stream of booleans which are True with probability p.
+    :param length: the stream length
+    :type length: int
+    :param p: the probability of True
+    :type p: float
+    :param seed: the seed, or None to use the random module state.
+    See generate_random_stream.
+    :type seed: int
+    :param use_numpy: whether to generate the stream with NumPy
+    :type use_numpy: bool
+    :returns: iterator
+    """
+    return itertools.chain.from_iterable(
+        generate_bernoulli_chunks(length, p=p, seed=seed,
+                                  use_numpy=use_numpy))
+
+
+def generate_bernoulli_chunks(length, p=0.5, seed=None,
+                              chunk_size=DEFAULT_CHUNK_SIZE,
+                              use_numpy=False):
+    """Generate a stream of booleans which are True with probability p,
+    as lists of chunk_size booleans (the last list may be shorter).
+    :param length: the stream length
+    :type length: int
+    :param p: the probability of True
+    :type p: float
+    :param seed: the seed, or None to use the random module state.
+    See generate_random_stream.
+    :type seed: int
+    :param chunk_size: the number of booleans per chunk
+    :type chunk_size: int
+    :param use_numpy: whether to generate the stream with NumPy
+    :type use_numpy: bool
+    :returns: iterator
+    """
+    if not (0 <= p <= 1):
+        error_msg = ("Invalid value for p: {}. "
+                     "p should be in [0, 1].".format(p))
+        raise ValueError(error_msg)
+    source = _RandomSource(seed, use_numpy)
+    return _generate_bernoulli_chunks(length, p, source, chunk_size)
+
+
+def _generate_bernoulli_chunks(length, p, source, chunk_size):
+    """Generator behind generate_bernoulli_chunks."""
+    for start in range(0, length, chunk_size):
+        yield source.booleans(min(chunk_size, length - start), p)
+
+
+def generate_bursty_stream(length, mean_on=10, mean_off=10, seed=None,
+                           use_numpy=False):
+    """Generate a stream of bursts of True and False. See
+    generate_bursty_chunks.
+    :returns: iterator
+    """
+    return itertools.chain.from_iterable(
+        generate_bursty_chunks(length, mean_on=mean_on, mean_off=mean_off,
+                               seed=seed, use_numpy=use_numpy))
+
+
+def generate_bursty_chunks(length, mean_on=10, mean_off=10, seed=None,
+                           chunk_size=DEFAULT_CHUNK_SIZE, use_numpy=False):
+    """Generate a stream of bursts of True and False, following an on/off
+    Markov chain, as lists of chunk_size booleans (the last list may be
+    shorter). The lengths of the bursts are geometric random variables.
+    :param length: the stream length
+    :type length: int
+    :param mean_on: the mean length of the bursts of True, >= 1
+    :type mean_on: float
+    :param mean_off: the mean length of the bursts of False, >= 1
+    :type mean_off: float
+    :param seed: the seed, or None to use the random module state.
+    See generate_random_stream.
+    :type seed: int
+    :param chunk_size: the number of booleans per chunk
+    :type chunk_size: int
+    :param use_numpy: whether to generate the stream with NumPy
+    :type use_numpy: bool
+    :returns: iterator
+    """
+    for name, mean in [("mean_on", mean_on), ("mean_off", mean_off)]:
+        if not mean >= 1:
+            error_msg = ("Invalid value for {}: {}. "
+                         "{} should be >= 1.".format(name, mean, name))
+            raise ValueError(error_msg)
+    source = _RandomSource(seed, use_numpy)
+    return _generate_bursty_chunks(length, mean_on, mean_off, source,
+                                   chunk_size)
+
+
+def _generate_bursty_chunks(length, mean_on, mean_off, source, chunk_size):
+    """Generator behind generate_bursty_chunks."""
+    # start in the stationary distribution of the chain
+    state = source.booleans(1, float(mean_on) / (mean_on + mean_off))[0]
+    chunk = []
+    nb_generated = 0
+    while nb_generated < length:
+        # draw the run lengths by batches
+        nb_runs = chunk_size // int(mean_on + mean_off) + 1
+        on_lengths = source.run_lengths(nb_runs, mean_on)
+        off_lengths = source.run_lengths(nb_runs, mean_off)
+        for on_length, off_length in zip(on_lengths, off_lengths):
+            for run_length in ((on_length, off_length) if state
+                               else (off_length, on_length)):
+                run_length = min(run_length, length - nb_generated)
+                chunk.extend([state] * run_length)
+                nb_generated += run_length
+                state = not state
+            while len(chunk) >= chunk_size:
+                yield chunk[:chunk_size]
+                del chunk[:chunk_size]
+            if nb_generated == length:
+                break
+    if chunk:
+        yield chunk
+
+
+def generate_periodic_stream(length, period, nb_true=1, offset=0):
+    """Generate a periodic stream of booleans. See
+    generate_periodic_chunks.
+    :returns: iterator
+    """
+    return itertools.chain.from_iterable(
+        generate_periodic_chunks(length, period, nb_true=nb_true,
+                                 offset=offset))
+
+
+def generate_periodic_chunks(length, period, nb_true=1, offset=0,
+                             chunk_size=DEFAULT_CHUNK_SIZE):
+    """Generate a periodic stream of booleans, as lists of chunk_size
+    booleans (the last list may be shorter). Each period starts with
+    nb_true True followed by period - nb_true False.
+    :param length: the stream length
+    :type length: int
+    :param period: the period
+    :type period: int
+    :param nb_true: the number of True per period
+    :type nb_true: int
+    :param offset: the position in the period of the first element
+    :type offset: int
+    :param chunk_size: the number of booleans per chunk
+    :type chunk_size: int
+    :returns: iterator
+    """
+    if period < 1:
+        error_msg = ("Invalid value for period: {}. "
+                     "Period should be >= 1.".format(period))
+        raise ValueError(error_msg)
+    if not (0 <= nb_true <= period):
+        error_msg = ("Invalid value for nb_true: {}. "
+                     "nb_true should be in [0, period].".format(nb_true))
+        raise ValueError(error_msg)
+    return _generate_periodic_chunks(length, period, nb_true, offset,
+                                     chunk_size)
+
+
+def _generate_periodic_chunks(length, period, nb_true, offset, chunk_size):
+    """Generator behind generate_periodic_chunks."""
+    pattern = [True] * nb_true + [False] * (period - nb_true)
+    # enough repetitions to slice any chunk from it
+    nb_repetitions = (chunk_size + period - 1) // period + 1
+    pattern = pattern * nb_repetitions
+    position = offset % period
+    for start in range(0, length, chunk_size):
+        size = min(chunk_size, length - start)
+        yield pattern[position:position + size]
+        position = (position + size) % period
+
+
+def generate_constant_stream(length, value):
+    """Generate a stream repeating the same boolean.
+    :param length: the stream length
+    :type length: int
+    :param value: the boolean
+    :type value: bool
+    :returns: iterator
+    """
+    return itertools.repeat(value, length)
+
+
+def generate_constant_chunks(length, value, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Generate a stream repeating the same boolean, as lists of
+    chunk_size booleans (the last list may be shorter).
     :param length: the stream length
     :type length: int
+    :param value: the boolean
+    :type value: bool
+    :param chunk_size: the number of booleans per chunk
+    :type chunk_size: int
     :returns: iterator
     """
-    for _ in range(length):
-        yield bool(random.randint(0, 1))
+    for start in range(0, length, chunk_size):
+        yield [value] * min(chunk_size, length - start)
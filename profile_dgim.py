@@ -13,7 +13,7 @@ def main():
     length = 2 * N
 
     dgim = Dgim(N=N, error_rate=error_rate)
-    stream = generate_random_stream(length=length)
+    stream = list(generate_random_stream(length=length, seed=0))
     time_start = time.time()
     profile_dgim(dgim, stream)
     time_stop = time.time()
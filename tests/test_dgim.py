@@ -1,4 +1,5 @@
 import unittest
+import random
 import itertools
 from collections import deque
 from dgim import Dgim
@@ -104,3 +105,29 @@ class TestDgim(unittest.TestCase):
         dgim._timestamp = 5
         self.assertFalse(dgim._is_bucket_too_old(16))
         self.assertTrue(dgim._is_bucket_too_old(15))
+
+    def test_skip(self):
+        rng = random.Random(0)
+        for N in [1, 2, 10, 100]:
+            dgim = Dgim(N)
+            reference = Dgim(N)
+            for _ in range(200):
+                nb_elements = rng.randint(0, 2 * N)
+                dgim.skip(nb_elements)
+                for _ in range(nb_elements):
+                    reference.update(False)
+                dgim.update(True)
+                reference.update(True)
+                self.assertEqual(reference.get_count(), dgim.get_count())
+                self.assertEqual(reference.nb_buckets, dgim.nb_buckets)
+
+    def test_nb_steps_before_expiry(self):
+        dgim = Dgim(10)
+        self.assertEqual(None, dgim.nb_steps_before_expiry)
+        dgim.update(True)
+        dgim.update(False)
+        self.assertEqual(9, dgim.nb_steps_before_expiry)
+        dgim.skip(8)
+        self.assertEqual(1, dgim.nb_steps_before_expiry)
+        dgim.skip(1)
+        self.assertEqual(None, dgim.nb_steps_before_expiry)
@@ -3,7 +3,9 @@ import itertools
 from collections import deque
 
 from dgim import Dgim
-from dgim.utils import generate_random_stream
+from dgim.utils import (generate_random_stream, generate_bernoulli_stream,
+                        generate_bursty_stream, generate_periodic_stream,
+                        generate_constant_stream)
 
 
 class ExactAlgorithm(object):
@@ -58,36 +60,57 @@ class TestDgimQuality(unittest.TestCase):
 
     def test_nominal_case(self):
         dgim = Dgim(N=100, error_rate=0.5)
-        stream = generate_random_stream(length=10000)
+        stream = generate_random_stream(length=10000, seed=0)
         self.check_quality_settings(dgim=dgim, stream=stream)
 
     def test_large_N(self):
         dgim = Dgim(N=10000, error_rate=0.5)
-        stream = generate_random_stream(length=2000)
+        stream = generate_random_stream(length=2000, seed=0)
         self.check_quality_settings(dgim=dgim, stream=stream)
 
     def test_short_stream(self):
         dgim = Dgim(N=1000, error_rate=0.5)
         # stream is shorter than N
-        stream = generate_random_stream(length=100)
+        stream = generate_random_stream(length=100, seed=0)
         self.check_quality_settings(dgim=dgim, stream=stream)
 
     def test_N_is_one(self):
         dgim = Dgim(N=1, error_rate=0.5)
-        stream = generate_random_stream(length=10)
+        stream = generate_random_stream(length=10, seed=0)
         self.check_quality_settings(dgim=dgim, stream=stream)
 
     def test_N_is_two(self):
         dgim = Dgim(N=2, error_rate=0.5)
-        stream = generate_random_stream(length=100)
+        stream = generate_random_stream(length=100, seed=0)
         self.check_quality_settings(dgim=dgim, stream=stream)
 
     def test_low_error_rate_case(self):
         dgim = Dgim(N=100, error_rate=0.01)
-        stream = generate_random_stream(length=1000)
+        stream = generate_random_stream(length=1000, seed=0)
         self.check_quality_settings(dgim=dgim, stream=stream)
 
     def test_only_true_case(self):
         dgim = Dgim(N=100, error_rate=0.5)
         stream = itertools.repeat(True, 10000)
         self.check_quality_settings(dgim=dgim, stream=stream)
+
+    def test_only_false_case(self):
+        dgim = Dgim(N=100, error_rate=0.5)
+        stream = generate_constant_stream(length=1000, value=False)
+        self.check_quality_settings(dgim=dgim, stream=stream)
+
+    def test_sparse_stream(self):
+        dgim = Dgim(N=1000, error_rate=0.1)
+        stream = generate_bernoulli_stream(length=10000, p=0.01, seed=0)
+        self.check_quality_settings(dgim=dgim, stream=stream)
+
+    def test_bursty_stream(self):
+        dgim = Dgim(N=1000, error_rate=0.1)
+        stream = generate_bursty_stream(length=10000, mean_on=50,
+                                        mean_off=200, seed=0)
+        self.check_quality_settings(dgim=dgim, stream=stream)
+
+    def test_periodic_stream(self):
+        dgim = Dgim(N=100, error_rate=0.2)
+        stream = generate_periodic_stream(length=10000, period=37, nb_true=5)
+        self.check_quality_settings(dgim=dgim, stream=stream)
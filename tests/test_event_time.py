@@ -0,0 +1,77 @@
+import unittest
+import random
+
+from dgim import Dgim, EventTimeDgim
+from dgim.utils import generate_random_stream
+
+
+class TestEventTimeDgim(unittest.TestCase):
+    def shuffled_events(self, length, max_lateness, seed=0):
+        """Returns events (event_time, elt) which arrive at most
+        max_lateness behind the latest event time."""
+        rng = random.Random(seed)
+        stream = list(generate_random_stream(length, seed=seed))
+        # each event is delayed by up to max_lateness
+        arrivals = sorted(range(length),
+                          key=lambda i: i + rng.uniform(0, max_lateness))
+        return [(i, stream[i]) for i in arrivals], stream
+
+    def test_in_order_stream(self):
+        event_time_dgim = EventTimeDgim(100)
+        dgim = Dgim(100)
+        for event_time, elt in enumerate(generate_random_stream(1000, 0)):
+            event_time_dgim.update(event_time, elt)
+            dgim.update(elt)
+            self.assertEqual(dgim.get_count(), event_time_dgim.get_count())
+        self.assertEqual(0, event_time_dgim.nb_buffered)
+
+    def test_reorder(self):
+        for batch_size in [1, 10, 1000]:
+            events, stream = self.shuffled_events(2000, max_lateness=20)
+            event_time_dgim = EventTimeDgim(100, max_lateness=20,
+                                            batch_size=batch_size)
+            for event_time, elt in events:
+                event_time_dgim.update(event_time, elt)
+            event_time_dgim.flush()
+            dgim = Dgim(100)
+            for elt in stream:
+                dgim.update(elt)
+            self.assertEqual(0, event_time_dgim.nb_late)
+            self.assertEqual(dgim.get_count(), event_time_dgim.get_count())
+
+    def test_commit_up_to_watermark(self):
+        event_time_dgim = EventTimeDgim(10, error_rate=0.1, max_lateness=2)
+        for event_time in [1, 3, 2, 4]:
+            event_time_dgim.update(event_time, True)
+        self.assertEqual(2, event_time_dgim.watermark)
+        self.assertEqual(2, event_time_dgim.get_count())
+        self.assertEqual(2, event_time_dgim.nb_buffered)
+
+    def test_late_elements(self):
+        event_time_dgim = EventTimeDgim(10, error_rate=0.1, max_lateness=2)
+        for event_time in [5, 3, 2, 6, 3]:
+            event_time_dgim.update(event_time, True)
+        # 2 is late after 5, 3 is late after 6
+        self.assertEqual(2, event_time_dgim.nb_late)
+        event_time_dgim.flush()
+        self.assertEqual(3, event_time_dgim.get_count())
+
+    def test_late_after_flush(self):
+        event_time_dgim = EventTimeDgim(10, error_rate=0.1, max_lateness=5)
+        event_time_dgim.update(5, True)
+        event_time_dgim.flush()
+        event_time_dgim.update(4, True)
+        self.assertEqual(1, event_time_dgim.nb_late)
+        event_time_dgim.update(5, True)
+        self.assertEqual(2, event_time_dgim.get_count())
+
+    def test_empty_stream(self):
+        event_time_dgim = EventTimeDgim(10)
+        self.assertEqual(None, event_time_dgim.watermark)
+        self.assertEqual(0, event_time_dgim.get_count())
+
+    def test_invalid_max_lateness(self):
+        self.assertRaises(ValueError, EventTimeDgim, 10, max_lateness=-1)
+
+    def test_invalid_batch_size(self):
+        self.assertRaises(ValueError, EventTimeDgim, 10, batch_size=0)
@@ -0,0 +1,87 @@
+import unittest
+import random
+from collections import deque
+
+from dgim import Dgim, ExactCounter, create_counter
+from dgim.planner import predict_footprint, predict_exact_footprint
+
+
+def predict_footprint_of(counter):
+    """Returns the predicted footprint of a counter."""
+    if isinstance(counter, ExactCounter):
+        return predict_exact_footprint(counter.N)
+    return predict_footprint(counter.N, counter.error_rate)
+
+
+class TestExactCounter(unittest.TestCase):
+    def test_get_count(self):
+        rng = random.Random(0)
+        for N in [1, 2, 7, 8, 9, 100]:
+            counter = ExactCounter(N)
+            sliding_window = deque(maxlen=N)
+            for _ in range(1000):
+                elt = rng.random() < 0.5
+                counter.update(elt)
+                sliding_window.append(elt)
+                self.assertEqual(sum(sliding_window), counter.get_count())
+
+    def test_count_empty_stream(self):
+        counter = ExactCounter(10)
+        self.assertEqual(0, counter.get_count())
+
+    def test_N_is_null(self):
+        counter = ExactCounter(0)
+        for elt in [True, False, True]:
+            counter.update(elt)
+        self.assertEqual(0, counter.get_count())
+
+    def test_only_true_elements_count(self):
+        counter = ExactCounter(10)
+        for elt in [True, 1, "True", False]:
+            counter.update(elt)
+        self.assertEqual(1, counter.get_count())
+
+    def test_footprint(self):
+        counter = ExactCounter(1000)
+        self.assertEqual(125, len(counter._bits))
+
+
+class TestCreateCounter(unittest.TestCase):
+    def test_small_window_is_exact(self):
+        self.assertTrue(isinstance(create_counter(1000), ExactCounter))
+
+    def test_large_window_is_approximate(self):
+        counter = create_counter(10 ** 7, error_rate=0.1)
+        self.assertTrue(isinstance(counter, Dgim))
+        self.assertEqual(0.1, counter.error_rate)
+
+    def test_memory_budget(self):
+        N = 10 ** 7
+        for memory_budget in [50000, 10 ** 5, 2 * 10 ** 6]:
+            counter = create_counter(N, error_rate=0.01,
+                                     memory_budget=memory_budget)
+            self.assertTrue(predict_footprint_of(counter) <= memory_budget)
+        self.assertTrue(isinstance(
+            create_counter(N, memory_budget=2 * 10 ** 6), ExactCounter))
+
+    def test_memory_budget_raises_error_rate(self):
+        N = 10 ** 7
+        footprint = predict_footprint(N, 0.01)
+        counter = create_counter(N, error_rate=0.01, memory_budget=footprint)
+        self.assertEqual(0.01, counter.error_rate)
+        # just below: the most accurate Dgim which fits is picked
+        counter = create_counter(N, error_rate=0.01,
+                                 memory_budget=footprint - 1)
+        self.assertTrue(isinstance(counter, Dgim))
+        self.assertTrue(counter.error_rate > 0.01)
+        self.assertTrue(predict_footprint_of(counter) < footprint)
+        self.assertTrue(
+            predict_footprint(N, 1. / (counter._r + 1)) >= footprint)
+        self.assertTrue(counter._r >= 90)
+
+    def test_memory_budget_too_small(self):
+        self.assertRaises(ValueError, create_counter, 10 ** 5,
+                          memory_budget=1000)
+
+    def test_invalid_error_rates(self):
+        self.assertRaises(ValueError, create_counter, 10, 0)
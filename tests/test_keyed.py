@@ -0,0 +1,60 @@
+import unittest
+import random
+
+from dgim import Dgim, KeyedDgim
+
+
+class TestKeyedDgim(unittest.TestCase):
+    def test_get_count(self):
+        keyed_dgim = KeyedDgim(5, error_rate=0.1)
+        for key in "aabab":
+            keyed_dgim.update(key)
+        self.assertEqual(3, keyed_dgim.get_count("a"))
+        self.assertEqual(2, keyed_dgim.get_count("b"))
+        self.assertEqual(0, keyed_dgim.get_count("c"))
+
+    def test_expiry(self):
+        keyed_dgim = KeyedDgim(3, error_rate=0.1)
+        for key in "abbb":
+            keyed_dgim.update(key)
+        self.assertEqual(0, keyed_dgim.get_count("a"))
+        self.assertEqual(1, keyed_dgim.nb_keys)
+        self.assertEqual([("b", 3)], keyed_dgim.top_k(2))
+
+    def test_top_k(self):
+        keyed_dgim = KeyedDgim(100, error_rate=0.1)
+        for key in "abbcccdddd":
+            keyed_dgim.update(key)
+        self.assertEqual([("d", 4), ("c", 3)], keyed_dgim.top_k(2))
+        # querying does not alter the index
+        self.assertEqual([("d", 4), ("c", 3)], keyed_dgim.top_k(2))
+        self.assertEqual(4, len(keyed_dgim.top_k(10)))
+
+    def test_N_is_null(self):
+        keyed_dgim = KeyedDgim(0)
+        keyed_dgim.update("a")
+        self.assertEqual(0, keyed_dgim.get_count("a"))
+        self.assertEqual([], keyed_dgim.top_k(1))
+
+    def test_invalid_error_rates(self):
+        self.assertRaises(ValueError, KeyedDgim, 10, 0)
+        self.assertRaises(ValueError, KeyedDgim, 10, 1.1)
+
+    def test_same_estimates_as_dgim(self):
+        """Each estimate should be the one of a Dgim fed with
+        the stream "element == key"."""
+        N = 50
+        rng = random.Random(0)
+        stream = [rng.choice("abcdefgh") for _ in range(1000)]
+        keyed_dgim = KeyedDgim(N, error_rate=0.2)
+        dgims = dict((key, Dgim(N, error_rate=0.2)) for key in "abcdefgh")
+        for elt in stream:
+            keyed_dgim.update(elt)
+            for key, dgim in dgims.items():
+                dgim.update(elt == key)
+            for key, dgim in dgims.items():
+                self.assertEqual(dgim.get_count(), keyed_dgim.get_count(key))
+            expected = sorted((dgim.get_count() for dgim in dgims.values()
+                               if dgim.get_count() > 0), reverse=True)
+            top = keyed_dgim.top_k(3)
+            self.assertEqual(expected[:3], [count for _, count in top])
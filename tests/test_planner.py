@@ -0,0 +1,95 @@
+import unittest
+import random
+import itertools
+
+from dgim import Dgim, ExactCounter
+from dgim.planner import (predict_nb_buckets, predict_footprint,
+                          predict_exact_footprint, measure_footprint,
+                          error_rate_for_budget, dgim_for_budget)
+
+
+class TestPlanner(unittest.TestCase):
+    def max_measures(self, dgim, stream, measure_every=1):
+        """Returns the maximum number of buckets and footprint
+        of a Dgim fed with a stream. The footprint is measured
+        every measure_every elements."""
+        max_nb_buckets = 0
+        max_footprint = 0
+        for i, elt in enumerate(stream):
+            dgim.update(elt)
+            max_nb_buckets = max(max_nb_buckets, dgim.nb_buckets)
+            if i % measure_every == 0:
+                max_footprint = max(max_footprint, measure_footprint(dgim))
+        return max_nb_buckets, max_footprint
+
+    def test_predict_nb_buckets(self):
+        self.assertEqual(0, predict_nb_buckets(0))
+        self.assertEqual(1, predict_nb_buckets(1))
+        for N, error_rate in itertools.product([2, 10, 100, 1000],
+                                               [1, 0.5, 0.1, 0.01]):
+            dgim = Dgim(N, error_rate)
+            nb_buckets, _ = self.max_measures(
+                dgim, itertools.repeat(True, 3 * N))
+            # an all "True" stream reaches the worst case
+            self.assertEqual(nb_buckets, predict_nb_buckets(N, error_rate))
+
+    def test_predict_footprint(self):
+        rng = random.Random(0)
+        settings = list(itertools.product([1, 10, 100, 1000],
+                                          [0.5, 0.1, 0.01]))
+        # the lowest error rates: r = N
+        settings += [(1000, 1. / 1000), (10000, 1. / 10000)]
+        for N, error_rate in settings:
+            predicted = predict_footprint(N, error_rate)
+            for stream in [itertools.repeat(True, 3 * N),
+                           (rng.random() < 0.7 for _ in range(3 * N))]:
+                dgim = Dgim(N, error_rate)
+                _, footprint = self.max_measures(
+                    dgim, stream, measure_every=max(1, N // 100))
+                self.assertTrue(footprint <= predicted)
+                self.assertTrue(predicted < 2 * footprint)
+
+    def test_predict_exact_footprint(self):
+        for N in [0, 1, 7, 8, 9, 1000, 10 ** 5]:
+            counter = ExactCounter(N)
+            for _ in range(N):
+                counter.update(True)
+            self.assertEqual(predict_exact_footprint(N),
+                             measure_footprint(counter))
+
+    def test_error_rate_for_budget(self):
+        N = 1000
+        previous_error_rate = 1
+        for memory_budget in [16000, 20000, 30000, 100000]:
+            error_rate = error_rate_for_budget(N, memory_budget)
+            self.assertTrue(error_rate <= previous_error_rate)
+            self.assertTrue(predict_footprint(N, error_rate) <= memory_budget)
+            # the next r does not fit
+            r = Dgim(N, error_rate)._r
+            if r < N:
+                self.assertTrue(
+                    predict_footprint(N, 1.0 / (r + 1)) > memory_budget)
+            previous_error_rate = error_rate
+
+    def test_error_rate_for_measured_budget(self):
+        """A budget equal to the footprint of the Dgim with r = N
+        is enough to get r = N."""
+        for N in [100, 1000]:
+            dgim = Dgim(N, 1. / N)
+            _, footprint = self.max_measures(dgim,
+                                             itertools.repeat(True, 3 * N))
+            error_rate = error_rate_for_budget(N, footprint)
+            self.assertEqual(N, Dgim(N, error_rate)._r)
+
+    def test_error_rate_for_large_budget(self):
+        # r can not usefully exceed N
+        error_rate = error_rate_for_budget(10, 10 ** 6)
+        self.assertEqual(10, Dgim(10, error_rate)._r)
+
+    def test_budget_too_small(self):
+        self.assertRaises(ValueError, error_rate_for_budget, 1000, 1000)
+
+    def test_dgim_for_budget(self):
+        dgim = dgim_for_budget(1000, 30000)
+        _, footprint = self.max_measures(dgim, itertools.repeat(True, 3000))
+        self.assertTrue(footprint <= 30000)
@@ -0,0 +1,104 @@
+import unittest
+import random
+
+from dgim import utils
+
+from dgim.utils import (generate_random_stream, generate_bernoulli_stream,
+                        generate_bernoulli_chunks, generate_bursty_stream,
+                        generate_bursty_chunks, generate_periodic_stream,
+                        generate_periodic_chunks, generate_constant_stream,
+                        generate_constant_chunks)
+
+
+class TestGenerators(unittest.TestCase):
+    def check_chunks(self, chunks, length, chunk_size):
+        """Check that the chunks are lists of booleans of chunk_size
+        elements, but the last one, and that they hold length elements."""
+        chunks = list(chunks)
+        for chunk in chunks[:-1]:
+            self.assertEqual(chunk_size, len(chunk))
+        self.assertEqual(length, sum(len(chunk) for chunk in chunks))
+        for chunk in chunks:
+            for elt in chunk:
+                self.assertTrue(elt is True or elt is False)
+
+    def test_chunks(self):
+        for length, chunk_size in [(0, 10), (1, 10), (10, 10), (1001, 10)]:
+            self.check_chunks(generate_bernoulli_chunks(
+                length, p=0.3, seed=0, chunk_size=chunk_size),
+                length, chunk_size)
+            self.check_chunks(generate_bursty_chunks(
+                length, seed=0, chunk_size=chunk_size), length, chunk_size)
+            self.check_chunks(generate_periodic_chunks(
+                length, 7, chunk_size=chunk_size), length, chunk_size)
+            self.check_chunks(generate_constant_chunks(
+                length, True, chunk_size=chunk_size), length, chunk_size)
+
+    def test_seed(self):
+        self.assertEqual(list(generate_random_stream(1000, seed=1)),
+                         list(generate_random_stream(1000, seed=1)))
+        self.assertNotEqual(list(generate_random_stream(1000, seed=1)),
+                            list(generate_random_stream(1000, seed=2)))
+        self.assertEqual(list(generate_bursty_stream(1000, seed=1)),
+                         list(generate_bursty_stream(1000, seed=1)))
+
+    def test_global_random_state(self):
+        random.seed(3)
+        stream = list(generate_bursty_stream(1000))
+        random.seed(3)
+        self.assertEqual(stream, list(generate_bursty_stream(1000)))
+
+    @unittest.skipIf(utils.numpy is None, "NumPy is not installed")
+    def test_numpy_seed(self):
+        self.assertEqual(
+            list(generate_random_stream(1000, seed=1, use_numpy=True)),
+            list(generate_random_stream(1000, seed=1, use_numpy=True)))
+
+    @unittest.skipIf(utils.numpy is not None, "NumPy is installed")
+    def test_numpy_missing(self):
+        self.assertRaises(ImportError, generate_random_stream, 10,
+                          use_numpy=True)
+
+    def test_bernoulli_density(self):
+        for p in [0, 0.1, 0.5, 0.9, 1]:
+            stream = list(generate_bernoulli_stream(10000, p=p, seed=0))
+            self.assertTrue(abs(sum(stream) / 10000. - p) < 0.02)
+
+    def test_bursty_density(self):
+        stream = list(generate_bursty_stream(100000, mean_on=5, mean_off=15,
+                                             seed=0))
+        self.assertTrue(abs(sum(stream) / 100000. - 0.25) < 0.02)
+        nb_bursts = sum(1 for previous, elt in zip(stream, stream[1:])
+                        if elt and not previous)
+        self.assertTrue(abs(nb_bursts / 100000. - 0.05) < 0.005)
+
+    def test_periodic(self):
+        stream = list(generate_periodic_stream(10, 4, nb_true=2, offset=1))
+        self.assertEqual([True, False, False, True, True, False, False,
+                          True, True, False], stream)
+        chunks = list(generate_periodic_chunks(10, 4, nb_true=2, offset=1,
+                                               chunk_size=3))
+        self.assertEqual(stream, sum(chunks, []))
+
+    def test_invalid_p(self):
+        self.assertRaises(ValueError, generate_bernoulli_chunks, 10, p=-0.1)
+        self.assertRaises(ValueError, generate_bernoulli_stream, 10, p=2)
+
+    def test_invalid_mean_lengths(self):
+        self.assertRaises(ValueError, generate_bursty_chunks, 10,
+                          mean_on=0.5)
+        self.assertRaises(ValueError, generate_bursty_stream, 10,
+                          mean_off=0)
+
+    def test_invalid_period(self):
+        self.assertRaises(ValueError, generate_periodic_chunks, 10, 0)
+        self.assertRaises(ValueError, generate_periodic_stream, 10, -1)
+
+    def test_invalid_nb_true(self):
+        self.assertRaises(ValueError, generate_periodic_chunks, 10, 4,
+                          nb_true=5)
+        self.assertRaises(ValueError, generate_periodic_stream, 10, 4,
+                          nb_true=-1)
+
+    def test_constant(self):
+        self.assertEqual([False] * 5, list(generate_constant_stream(5, False)))